@@ -19,6 +19,41 @@ from imblearn.over_sampling import SMOTE
 from sklearn.utils.class_weight import compute_class_weight
 from sklearn.ensemble import IsolationForest
 import joblib
+from joblib import parallel_backend
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+try:
+    import lz4  # noqa: F401
+    joblib_compress = ('lz4', 1)
+except ImportError:  # lz4 is optional; fall back to zlib
+    joblib_compress = ('zlib', 3)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def row_std(X):
+        """Population standard deviation of each row of a 2-D array."""
+        n, m = X.shape
+        out = np.empty(n)
+        for i in prange(n):
+            s = 0.0
+            for j in range(m):
+                s += X[i, j]
+            mean = s / m
+            ss = 0.0
+            for j in range(m):
+                d = X[i, j] - mean
+                ss += d * d
+            out[i] = np.sqrt(ss / m)
+        return out
+else:
+    def row_std(X):
+        """Population standard deviation of each row of a 2-D array."""
+        return np.std(X, axis=1)
 
 
 def generate_realistic_cheating_data(n_samples=1000, cheater_ratio=0.15):
@@ -37,32 +72,30 @@ def generate_realistic_cheating_data(n_samples=1000, cheater_ratio=0.15):
     pandas.DataFrame
         DataFrame with features and target variable
     """
-    np.random.seed(42)  # for reproducibility
+    rng = np.random.default_rng(42)  # for reproducibility
 
     # Determine number of cheaters
     n_cheaters = int(n_samples * cheater_ratio)
     n_non_cheaters = n_samples - n_cheaters
 
+    # Preallocate the combined columns: non-cheaters first, then cheaters
+    ability = np.empty(n_samples)
+    cheater = np.zeros(n_samples, dtype=int)
+    cheater[n_non_cheaters:] = 1
+    coursework_raw = np.empty(n_samples)
+    exam_raw = np.empty(n_samples)
+
     # Generate non-cheater data first
-    non_cheaters = pd.DataFrame({
-        # Base academic performance (underlying ability)
-        'ability': np.random.normal(0, 1, n_non_cheaters),
-        'cheater': np.zeros(n_non_cheaters, dtype=int)
-    })
+    # Base academic performance (underlying ability)
+    ability[:n_non_cheaters] = rng.normal(0, 1, n_non_cheaters)
 
     # Generate coursework and exam scores based on ability for non-cheaters
-    non_cheaters['coursework_raw'] = non_cheaters['ability'] + np.random.normal(0, 0.8, n_non_cheaters)
-    non_cheaters['exam_raw'] = non_cheaters['ability'] + np.random.normal(0, 0.8, n_non_cheaters)
+    coursework_raw[:n_non_cheaters] = ability[:n_non_cheaters] + rng.normal(0, 0.8, n_non_cheaters)
+    exam_raw[:n_non_cheaters] = ability[:n_non_cheaters] + rng.normal(0, 0.8, n_non_cheaters)
 
     # Generate cheater data
-    cheaters = pd.DataFrame({
-        # Base academic performance (slightly lower on average)
-        'ability': np.random.normal(-0.5, 1, n_cheaters),
-        'cheater': np.ones(n_cheaters, dtype=int)
-    })
-
-    # Generate coursework scores based on ability for cheaters
-    cheaters['coursework_raw'] = cheaters['ability'] + np.random.normal(0, 0.8, n_cheaters)
+    # Base academic performance (slightly lower on average)
+    ability[n_non_cheaters:] = rng.normal(-0.5, 1, n_cheaters)
 
     # Generate exam scores with CLEAR differences for cheaters:
     # 1. Some cheaters do much better on coursework than exams (copied/plagiarized)
@@ -70,84 +103,87 @@ def generate_realistic_cheating_data(n_samples=1000, cheater_ratio=0.15):
     # 3. Some cheaters show suspicious pattern consistency
 
     # Split cheaters into different types
-    cheater_types = np.random.choice(['coursework_advantage', 'exam_advantage', 'consistent'],
+    cheater_types = rng.choice(['coursework_advantage', 'exam_advantage', 'consistent'],
                                      size=n_cheaters, p=[0.5, 0.3, 0.2])
 
-    # Apply different patterns based on cheater type
-    for i, cheater_type in enumerate(cheater_types):
-        if cheater_type == 'coursework_advantage':
-            # Coursework performance much higher than expected from ability
-            cheaters.loc[i, 'coursework_raw'] = cheaters.loc[i, 'ability'] + np.random.uniform(1.0, 2.5)
-            cheaters.loc[i, 'exam_raw'] = cheaters.loc[i, 'ability'] + np.random.normal(0, 0.8)
-
-        elif cheater_type == 'exam_advantage':
-            # Exam performance much higher than expected from ability
-            cheaters.loc[i, 'coursework_raw'] = cheaters.loc[i, 'ability'] + np.random.normal(0, 0.8)
-            cheaters.loc[i, 'exam_raw'] = cheaters.loc[i, 'ability'] + np.random.uniform(1.5, 3.0)
-
-        else:  # consistent
-            # Suspiciously consistent high performance across both
-            both_boost = np.random.uniform(1.0, 2.0)
-            cheaters.loc[i, 'coursework_raw'] = cheaters.loc[i, 'ability'] + both_boost + np.random.normal(0, 0.2)
-            cheaters.loc[i, 'exam_raw'] = cheaters.loc[i, 'ability'] + both_boost + np.random.normal(0, 0.2)
-
-    # Combine datasets
-    data = pd.concat([non_cheaters, cheaters]).reset_index(drop=True)
+    mask_cw = cheater_types == 'coursework_advantage'
+    mask_ex = cheater_types == 'exam_advantage'
+    mask_cons = cheater_types == 'consistent'
+
+    # Draw every cheater's boosts and noise up front, then pick per type
+    cw_boost = rng.uniform(1.0, 2.5, n_cheaters)
+    ex_boost = rng.uniform(1.5, 3.0, n_cheaters)
+    both_boost = rng.uniform(1.0, 2.0, n_cheaters)
+    noise_cw = rng.normal(0, 0.8, n_cheaters)
+    noise_ex = rng.normal(0, 0.8, n_cheaters)
+    noise_small_cw = rng.normal(0, 0.2, n_cheaters)
+    noise_small_ex = rng.normal(0, 0.2, n_cheaters)
+
+    cheater_ability = ability[n_non_cheaters:]
+
+    # Coursework advantage: coursework much higher than expected from ability
+    # Exam advantage: exam much higher than expected from ability
+    # Consistent: suspiciously consistent high performance across both
+    coursework_raw[n_non_cheaters:] = np.where(
+        mask_cw, cheater_ability + cw_boost,
+        np.where(mask_cons, cheater_ability + both_boost + noise_small_cw, cheater_ability + noise_cw))
+    exam_raw[n_non_cheaters:] = np.where(
+        mask_ex, cheater_ability + ex_boost,
+        np.where(mask_cons, cheater_ability + both_boost + noise_small_ex, cheater_ability + noise_ex))
+
+    # Build the combined dataset once
+    data = pd.DataFrame({
+        'ability': ability,
+        'cheater': cheater,
+        'coursework_raw': coursework_raw,
+        'exam_raw': exam_raw
+    })
 
     # Generate other meaningful features
 
     # Subject variation (cheaters often have less variation)
     n_subjects = 5
-    subject_scores = np.zeros((n_samples, n_subjects))
-
-    for i in range(n_samples):
-        base_ability = data.loc[i, 'ability']
-        if data.loc[i, 'cheater'] == 0:
-            # Non-cheaters: performance varies by subject
-            subject_scores[i] = base_ability + np.random.normal(0, 1, n_subjects)
-        else:
-            # Cheaters: performance varies less in subjects they cheat in
-            if np.random.random() < 0.7:  # 70% of cheaters have less subject variation
-                subject_scores[i] = base_ability + np.random.normal(0, 0.4, n_subjects)
-            else:
-                subject_scores[i] = base_ability + np.random.normal(0, 1, n_subjects)
-
-    data['subject_variation'] = np.std(subject_scores, axis=1)
+    is_cheater = cheater == 1
+
+    # Non-cheaters: performance varies by subject
+    # Cheaters: 70% vary less in the subjects they cheat in
+    sigma_subject = np.where(is_cheater & (rng.random(n_samples) < 0.7), 0.4, 1.0)
+    Z = rng.normal(0, 1, (n_samples, n_subjects))
+    subject_scores = ability[:, None] + Z * sigma_subject[:, None]
+
+    data['subject_variation'] = row_std(subject_scores)
 
     # Historical trend (cheaters may show sudden improvements)
-    past_performance = data['ability'] + np.random.normal(0, 0.5, n_samples)
-    current_performance = (data['coursework_raw'] + data['exam_raw']) / 2
+    past_performance = ability + rng.normal(0, 0.5, n_samples)
+    current_performance = (coursework_raw + exam_raw) / 2
 
     # Add sudden improvement for some cheaters
-    cheater_indices = data[data['cheater'] == 1].index
-    sudden_improvers = np.random.choice(cheater_indices, size=int(len(cheater_indices) * 0.6), replace=False)
-    for idx in sudden_improvers:
-        past_performance[idx] -= np.random.uniform(0.5, 1.5)  # Make past performance worse
+    cheater_indices = np.flatnonzero(is_cheater)
+    sudden_improvers = rng.choice(cheater_indices, size=int(len(cheater_indices) * 0.6), replace=False)
+    past_performance[sudden_improvers] -= rng.uniform(0.5, 1.5, size=sudden_improvers.size)  # Make past performance worse
 
     data['historical_trend'] = current_performance - past_performance
 
     # Time spent features (many cheaters finish suspiciously quickly or slowly)
-    data['exam_time_std'] = np.random.normal(0, 1, n_samples)
-    for i in cheater_indices:
-        if np.random.random() < 0.4:
-            # Some cheaters finish very quickly (had answers)
-            data.loc[i, 'exam_time_std'] = -np.random.uniform(1.5, 3)
-        elif np.random.random() < 0.7:
-            # Some cheaters take unusually long (looking up answers)
-            data.loc[i, 'exam_time_std'] = np.random.uniform(1.5, 3)
+    exam_time_std = rng.normal(0, 1, n_samples)
+    n_c = len(cheater_indices)
+    r1 = rng.random(n_c)
+    r2 = rng.random(n_c)
+    # Some cheaters finish very quickly (had answers)
+    fast = -rng.uniform(1.5, 3, n_c)
+    # Some cheaters take unusually long (looking up answers)
+    slow = rng.uniform(1.5, 3, n_c)
+    base = exam_time_std[cheater_indices]
+    exam_time_std[cheater_indices] = np.where(r1 < 0.4, fast, np.where(r2 < 0.7, slow, base))
+    data['exam_time_std'] = exam_time_std
 
     # Peer comparison (performance relative to peer group)
-    ability_percentiles = np.percentile(data['ability'], [33, 66])
-    ability_groups = np.digitize(data['ability'], bins=ability_percentiles)
-
-    # Fix: Changed the range to include 0, 1 and 2 for ability groups
-    avg_group_exam = {i: data.loc[ability_groups == i, 'exam_raw'].mean() for i in range(0, 3)}
-    data['peer_comparison'] = 0.0
+    ability_percentiles = np.percentile(ability, [33, 66])
+    ability_groups = np.digitize(ability, bins=ability_percentiles)
 
-    for i in range(n_samples):
-        group = ability_groups[i]
-        expected_score = avg_group_exam[group]
-        data.loc[i, 'peer_comparison'] = data.loc[i, 'exam_raw'] - expected_score
+    # Expected score is the mean exam score of the student's ability group
+    group_means = data.groupby(ability_groups)['exam_raw'].transform('mean')
+    data['peer_comparison'] = data['exam_raw'].values - group_means.values
 
     # Calculate standard z-scores
     data['coursework_z'] = (data['coursework_raw'] - data['coursework_raw'].mean()) / data['coursework_raw'].std()
@@ -155,24 +191,23 @@ def generate_realistic_cheating_data(n_samples=1000, cheater_ratio=0.15):
     data['z_diff'] = data['coursework_z'] - data['exam_z']
 
     # Score variance (consistency across different assessments)
-    for i in range(n_samples):
-        if data.loc[i, 'cheater'] == 1:
-            # Generate more assessments
-            if np.random.random() < 0.7:  # 70% of cheaters have suspicious consistency
-                assessments = data.loc[i, 'ability'] + np.random.normal(1.2, 0.3, 8)  # low variance, high mean
-            else:
-                assessments = data.loc[i, 'ability'] + np.random.normal(0, 1, 8)
-        else:
-            assessments = data.loc[i, 'ability'] + np.random.normal(0, 1, 8)
-
-        data.loc[i, 'score_variance'] = np.std(assessments)
+    n_assessments = 8
+    # 70% of cheaters have suspicious consistency: low variance, high mean
+    suspicious = is_cheater & (rng.random(n_samples) < 0.7)
+    mu_assess = np.where(suspicious, 1.2, 0.0)
+    sigma_assess = np.where(suspicious, 0.3, 1.0)
+    Z = rng.normal(0, 1, (n_samples, n_assessments))
+    assessments = ability[:, None] + mu_assess[:, None] + Z * sigma_assess[:, None]
+
+    data['score_variance'] = row_std(assessments)
 
     # Add anomaly score using Isolation Forest on legitimate features
     features_for_anomaly = ['coursework_z', 'exam_z', 'z_diff', 'score_variance',
                            'subject_variation', 'historical_trend']
 
-    iso_forest = IsolationForest(contamination=0.2, random_state=42)
-    anomaly_scores = iso_forest.fit_predict(data[features_for_anomaly])
+    iso_forest = IsolationForest(contamination=0.2, n_estimators=100, max_samples=256, n_jobs=-1, random_state=42)
+    with parallel_backend('threading', n_jobs=-1):
+        anomaly_scores = iso_forest.fit_predict(data[features_for_anomaly])
     data['anomaly_score'] = anomaly_scores
 
     # Convert anomaly scores to a more intuitive scale (higher = more anomalous)
@@ -195,40 +230,43 @@ X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_
 smote = SMOTE(random_state=42)
 X_train_balanced, y_train_balanced = smote.fit_resample(X_train, y_train)
 
-# Scaling the features
+# Scaling the features (float32 is what sklearn's tree code works in anyway)
 scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train_balanced)
-X_test_scaled = scaler.transform(X_test)
+X_train_scaled = scaler.fit_transform(X_train_balanced).astype(np.float32, copy=False)
+X_test_scaled = scaler.transform(X_test).astype(np.float32, copy=False)
 
 # Compute class weights
 class_weights = compute_class_weight(class_weight='balanced', classes=np.unique(y_train_balanced), y=y_train_balanced)
 class_weights_dict = {0: class_weights[0], 1: class_weights[1]}
 
 # Save processed data, scaler, and class weights (needed for loading)
+# Feature arrays stay uncompressed so they can be memory-mapped on load
 joblib.dump(X_train_scaled, 'X_train_scaled.joblib')
 joblib.dump(X_test_scaled, 'X_test_scaled.joblib')
-joblib.dump(y_train_balanced, 'y_train_balanced.joblib')
-joblib.dump(y_test, 'y_test.joblib')
-joblib.dump(scaler, 'scaler.joblib')
-joblib.dump(class_weights_dict, 'class_weights_dict.joblib')
+joblib.dump(y_train_balanced, 'y_train_balanced.joblib', compress=joblib_compress)
+joblib.dump(y_test, 'y_test.joblib', compress=joblib_compress)
+joblib.dump(scaler, 'scaler.joblib', compress=joblib_compress)
+joblib.dump(class_weights_dict, 'class_weights_dict.joblib', compress=joblib_compress)
 print("Data, scaler, and class weights saved.")
 
 """# **Grid Search and Model Training**"""
 
 # %%
 # Grid Search and Model Training
-from sklearn.model_selection import GridSearchCV
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import fbeta_score
+from sklearn.metrics import precision_recall_curve
 import joblib
+from joblib import parallel_backend
 
 # Load the training data, and class weights
-X_train_scaled = joblib.load('X_train_scaled.joblib')
+X_train_scaled = joblib.load('X_train_scaled.joblib', mmap_mode='r')
 y_train_balanced = joblib.load('y_train_balanced.joblib')
 class_weights_dict = joblib.load('class_weights_dict.joblib')
-# Hyperparameter tuning with GridSearchCV
+# Hyperparameter tuning with successive halving; n_estimators is the budget
+# each round grows (30 -> 90 -> 270), so it is not part of the grid
 param_grid = {
-    'n_estimators': [100, 200, 300],
     'max_depth': [10, 20, None],
     'min_samples_split': [2, 5, 10],
     'min_samples_leaf': [1, 2, 4],
@@ -236,7 +274,8 @@ param_grid = {
 }
 
 rf_clf_weighted = RandomForestClassifier(class_weight=class_weights_dict, random_state=42)
-grid_search = GridSearchCV(estimator=rf_clf_weighted, param_grid=param_grid, cv=3, scoring='f1', n_jobs=-1)
+grid_search = HalvingGridSearchCV(estimator=rf_clf_weighted, param_grid=param_grid, cv=3, scoring='f1', n_jobs=-1,
+                                  factor=3, resource='n_estimators', max_resources=300, min_resources=30)
 grid_search.fit(X_train_scaled, y_train_balanced)
 
 # Best hyperparameters
@@ -248,25 +287,22 @@ rf_clf_best = RandomForestClassifier(**best_params, class_weight=class_weights_d
 rf_clf_best.fit(X_train_scaled, y_train_balanced)
 
 # Save the model
-joblib.dump(rf_clf_best, 'cheating_detection_model.pkl')
+joblib.dump(rf_clf_best, 'cheating_detection_model.pkl', compress=joblib_compress)
 print("Model saved as cheating_detection_model.pkl")
 
 # Determine optimal threshold
-X_test_scaled = joblib.load('X_test_scaled.joblib')
+X_test_scaled = joblib.load('X_test_scaled.joblib', mmap_mode='r')
 y_test = joblib.load('y_test.joblib')
-y_probs = rf_clf_best.predict_proba(X_test_scaled)[:, 1]
-thresholds = np.linspace(0, 1, 100)
-best_threshold = 0.5
-best_f1 = 0
-for threshold in thresholds:
-    y_pred = (y_probs > threshold).astype(int)
-    f1 = fbeta_score(y_test, y_pred, beta=1)
-    if f1 > best_f1:
-        best_f1 = f1
-        best_threshold = threshold
+with parallel_backend('threading', n_jobs=-1):
+    y_probs = rf_clf_best.predict_proba(X_test_scaled)[:, 1]
+precisions, recalls, thresholds = precision_recall_curve(y_test, y_probs)
+f1_scores = 2 * precisions * recalls / np.where(precisions + recalls > 0, precisions + recalls, 1)
+# precision_recall_curve thresholds are inclusive (>=) but predictions use >,
+# so step just below the best one to keep the same students flagged
+best_threshold = np.nextafter(thresholds[np.argmax(f1_scores[:-1])], -np.inf)
 print(f"Best Threshold: {best_threshold}")
 
-joblib.dump(best_threshold, 'best_threshold.joblib')
+joblib.dump(best_threshold, 'best_threshold.joblib', compress=joblib_compress)
 print("Best threshold saved.")
 
 """# **Model Loading and Analysis**"""
@@ -277,17 +313,15 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.metrics import classification_report, confusion_matrix
 import joblib
+from joblib import parallel_backend
 import seaborn as sns
 
 
-def analyze_student_with_dashboard(student_id, student_data, model, feature_names, threshold):
+def analyze_student_with_dashboard(student_id, student_data, model, feature_names, threshold, angles):
     """Analyzes a specific student and provides a prediction and radar chart."""
 
-    # Convert single student data to a DataFrame
-    student_df = pd.DataFrame([student_data], columns=feature_names)
-
-    # Get model prediction probabilities
-    prob = model.predict_proba(student_df)[:, 1][0]
+    # Get model prediction probabilities (the model was fitted on plain arrays)
+    prob = model.predict_proba(student_data.reshape(1, -1))[0, 1]
     prediction = 1 if prob > threshold else 0
 
     # Create a radar chart (optional)
@@ -295,9 +329,7 @@ def analyze_student_with_dashboard(student_id, student_data, model, feature_name
     categories = feature_names
     values = student_data
 
-    angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-    values = np.append(values, values[0])  # Loop back to start
-    angles += angles[:1]
+    values = np.concatenate([values, values[:1]])  # Loop back to start
 
     ax = radar_fig.add_subplot(111, polar=True)
     ax.fill(angles, values, color='blue', alpha=0.25)
@@ -314,20 +346,32 @@ def analyze_student_with_dashboard(student_id, student_data, model, feature_name
 
     return prediction, report, {'radar_chart': radar_fig}
 
-# Load the model, scaler, and threshold
-rf_clf_best = joblib.load('cheating_detection_model.pkl')
-scaler = joblib.load('scaler.joblib')
-best_threshold = joblib.load('best_threshold.joblib')
+# Load the model, scaler, threshold, and test data once for all the analysis below
+_ARTIFACTS = {
+    'model': joblib.load('cheating_detection_model.pkl'),
+    'scaler': joblib.load('scaler.joblib'),
+    'best_threshold': joblib.load('best_threshold.joblib'),
+    'X_test_scaled': joblib.load('X_test_scaled.joblib', mmap_mode='r'),
+    'y_test': joblib.load('y_test.joblib'),
+}
+rf_clf_best = _ARTIFACTS['model']
+scaler = _ARTIFACTS['scaler']
+best_threshold = _ARTIFACTS['best_threshold']
 
 # Prepare data for analysis (using the same features as during training)
 X = improved_data[['coursework_z', 'exam_z', 'z_diff', 'score_variance', 'exam_time_std', 'peer_comparison', 'subject_variation', 'historical_trend', 'anomaly_score']]
 feature_names = X.columns.tolist()
 
-X_test_scaled = joblib.load('X_test_scaled.joblib')
-y_test = joblib.load('y_test.joblib')
+# Radar chart angles are the same for every student, so compute them once
+radar_angles = np.linspace(0, 2 * np.pi, len(feature_names), endpoint=False)
+radar_angles = np.concatenate([radar_angles, radar_angles[:1]])
+
+X_test_scaled = _ARTIFACTS['X_test_scaled']
+y_test = _ARTIFACTS['y_test']
 
 # Evaluate the model on the test set
-y_probs = rf_clf_best.predict_proba(X_test_scaled)[:, 1]
+with parallel_backend('threading', n_jobs=-1):
+    y_probs = rf_clf_best.predict_proba(X_test_scaled)[:, 1]
 y_pred = (y_probs > best_threshold).astype(int)
 print("Classification Report:\n", classification_report(y_test, y_pred))
 print("Confusion Matrix:\n", confusion_matrix(y_test, y_pred))
@@ -359,6 +403,7 @@ prediction, report, figures = analyze_student_with_dashboard(
     model=rf_clf_best,
     feature_names=feature_names,
     threshold=best_threshold,
+    angles=radar_angles,
 )
 print(report)
 if 'radar_chart' in figures:
@@ -369,29 +414,21 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.metrics import classification_report, confusion_matrix
 import joblib
+from joblib import parallel_backend
 import seaborn as sns
 
-def analyze_student(student_id, student_data, model, feature_names, threshold):
-    """Analyzes a specific student and provides a prediction along with feature contributions and radar chart."""
-
-    # Convert single student data to a DataFrame
-    student_df = pd.DataFrame([student_data], columns=feature_names)
-
-    # Get model prediction probabilities
-    prob = model.predict_proba(student_df)[:, 1][0]
-    prediction = 1 if prob > threshold else 0
-
-    # Feature contributions
-    feature_contributions = dict(zip(feature_names, model.feature_importances_ * student_data))
+def plot_student_radar(student_data, feature_names, angles, radar_fig=None):
+    """Draws a student's radar chart, reusing radar_fig if one is given."""
 
     # Create a radar chart
-    radar_fig = plt.figure(figsize=(6, 6))
+    if radar_fig is None:
+        radar_fig = plt.figure(figsize=(6, 6))
+    else:
+        radar_fig.clear()
     categories = feature_names
     values = student_data
 
-    angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-    values = np.append(values, values[0])  # Loop back to start
-    angles += angles[:1]
+    values = np.concatenate([values, values[:1]])  # Loop back to start
 
     ax = radar_fig.add_subplot(111, polar=True)
     ax.fill(angles, values, color='blue', alpha=0.25)
@@ -399,15 +436,15 @@ def analyze_student(student_id, student_data, model, feature_names, threshold):
     ax.set_xticks(angles[:-1])
     ax.set_xticklabels(categories)
 
-    return prediction, prob, feature_contributions, radar_fig
+    return radar_fig
 
 # Load the model and scaler
-rf_clf_best = joblib.load('cheating_detection_model.pkl')
-scaler = joblib.load('scaler.joblib')
+rf_clf_best = _ARTIFACTS['model']
+scaler = _ARTIFACTS['scaler']
 
 # Load the test data
-X_test_scaled = joblib.load('X_test_scaled.joblib')
-y_test = joblib.load('y_test.joblib')
+X_test_scaled = _ARTIFACTS['X_test_scaled']
+y_test = _ARTIFACTS['y_test']
 
 from sklearn.metrics import precision_recall_curve
 
@@ -430,7 +467,8 @@ X = improved_data[['coursework_z', 'exam_z', 'z_diff', 'score_variance', 'exam_t
 feature_names = X.columns.tolist()
 
 # Evaluate the model on the test set
-y_probs = rf_clf_best.predict_proba(X_test_scaled)[:, 1]
+with parallel_backend('threading', n_jobs=-1):
+    y_probs = rf_clf_best.predict_proba(X_test_scaled)[:, 1]
 y_pred = (y_probs > optimal_threshold).astype(int)
 print("Classification Report:\n", classification_report(y_test, y_pred))
 print("Confusion Matrix:\n", confusion_matrix(y_test, y_pred))
@@ -452,26 +490,16 @@ print(feature_importances.sort_values(ascending=False))
 print("\nDescriptive statistics of feature importances:")
 print(feature_importances.describe())
 
-# List all students likely cheating
-likely_cheaters = []
-for student_index in range(X_test_scaled.shape[0]):
-    student_data = X_test_scaled[student_index]
-    prediction, prob, feature_contributions, radar_fig = analyze_student(
-        student_id=student_index,
-        student_data=student_data,
-        model=rf_clf_best,
-        feature_names=feature_names,
-        threshold=optimal_threshold,
-    )
-    if prediction == 1:
-        likely_cheaters.append({
-            'Student ID': student_index,
-            'Predicted Probability': prob,
-            'Feature Contributions': feature_contributions,
-            'Radar Chart': radar_fig
-        })
-
-# Convert the list of likely cheaters to a DataFrame
+# List all students likely cheating, from the batched predictions above
+likely_cheater_ids = np.flatnonzero(y_probs > optimal_threshold)
+contributions = X_test_scaled[likely_cheater_ids] * rf_clf_best.feature_importances_
+likely_cheaters = {
+    'Student ID': likely_cheater_ids,
+    'Predicted Probability': y_probs[likely_cheater_ids],
+    'Feature Contributions': [dict(zip(feature_names, row)) for row in contributions]
+}
+
+# Convert the likely cheaters to a DataFrame
 cheaters_df = pd.DataFrame(likely_cheaters)
 
 # Generate a summary table
@@ -483,14 +511,21 @@ print(summary_table)
 print("\nSummary Statistics of Cheaters' Predicted Probabilities:\n")
 print(cheaters_df['Predicted Probability'].describe())
 
-# Display detailed analysis for each cheater
-for index, row in cheaters_df.iterrows():
-    print(f"\nDetailed Analysis for Student ID {row['Student ID']}:\n")
-    print(f"Predicted Probability: {row['Predicted Probability']:.2f}")
+# Display detailed analysis for each cheater, drawing radar charts on one reused figure
+radar_fig = None
+student_ids = cheaters_df['Student ID'].to_numpy()
+student_probs = cheaters_df['Predicted Probability'].to_numpy()
+student_contributions = cheaters_df['Feature Contributions'].tolist()
+for student_id, prob, feature_contributions in zip(student_ids, student_probs, student_contributions):
+    print(f"\nDetailed Analysis for Student ID {student_id}:\n")
+    print(f"Predicted Probability: {prob:.2f}")
     print("Feature Contributions:")
-    for feature, contribution in row['Feature Contributions'].items():
+    for feature, contribution in feature_contributions.items():
         print(f"  {feature}: {contribution:.2f}")
-    row['Radar Chart'].show()
+    radar_fig = plot_student_radar(X_test_scaled[student_id], feature_names, radar_angles, radar_fig)
+    radar_fig.savefig(f"radar_chart_{student_id}.png")
+if radar_fig is not None:
+    plt.close(radar_fig)
 
 # Summary distribution chart for all cheaters
 plt.figure(figsize=(10, 6))
@@ -505,30 +540,16 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.metrics import classification_report, confusion_matrix
 import joblib
+from joblib import parallel_backend
 import seaborn as sns
 
-def analyze_student(student_id, student_data, model, feature_names, threshold):
-    """Analyzes a specific student and provides a prediction along with feature contributions and radar chart."""
-
-    # Convert single student data to a DataFrame
-    student_df = pd.DataFrame([student_data], columns=feature_names)
-
-    # Get model prediction probabilities
-    prob = model.predict_proba(student_df)[:, 1][0]
-    prediction = 1 if prob > threshold else 0
-
-    # Feature contributions
-    feature_contributions = dict(zip(feature_names, model.feature_importances_ * student_data))
-
-    return prediction, prob, feature_contributions
-
 # Load the model and scaler
-rf_clf_best = joblib.load('cheating_detection_model.pkl')
-scaler = joblib.load('scaler.joblib')
+rf_clf_best = _ARTIFACTS['model']
+scaler = _ARTIFACTS['scaler']
 
 # Load the test data
-X_test_scaled = joblib.load('X_test_scaled.joblib')
-y_test = joblib.load('y_test.joblib')
+X_test_scaled = _ARTIFACTS['X_test_scaled']
+y_test = _ARTIFACTS['y_test']
 
 from sklearn.metrics import precision_recall_curve
 
@@ -551,32 +572,18 @@ X = improved_data[['coursework_z', 'exam_z', 'z_diff', 'score_variance', 'exam_t
 feature_names = X.columns.tolist()
 
 # Evaluate the model on the test set
-y_probs = rf_clf_best.predict_proba(X_test_scaled)[:, 1]
+with parallel_backend('threading', n_jobs=-1):
+    y_probs = rf_clf_best.predict_proba(X_test_scaled)[:, 1]
 y_pred = (y_probs > optimal_threshold).astype(int)
 print("Classification Report:\n", classification_report(y_test, y_pred))
 print("Confusion Matrix:\n", confusion_matrix(y_test, y_pred))
 
-# Initialize a list to store student data
-students_list = []
-
-# Analyze each student and store the results
-for student_index in range(X_test_scaled.shape[0]):
-    student_data = X_test_scaled[student_index]
-    prediction, prob, feature_contributions = analyze_student(
-        student_id=student_index,
-        student_data=student_data,
-        model=rf_clf_best,
-        feature_names=feature_names,
-        threshold=optimal_threshold,
-    )
-    students_list.append({
-        'Student ID': student_index,
-        'Predicted Probability': prob,
-        'Cheater': 'Yes' if prediction == 1 else 'No'
-    })
-
-# Convert the list of students to a DataFrame
-students_df = pd.DataFrame(students_list)
+# Analyze every student at once from the batched predictions above
+students_df = pd.DataFrame({
+    'Student ID': np.arange(X_test_scaled.shape[0]),
+    'Predicted Probability': y_probs,
+    'Cheater': np.where(y_pred == 1, 'Yes', 'No')
+})
 
 # Generate a summary table
 summary_table = students_df[['Student ID', 'Predicted Probability', 'Cheater']]